@@ -37,14 +37,17 @@ def setup_credentials():
     # Create config directory if needed
     os.makedirs(config_dir, exist_ok=True)
 
-    # Write config
+    # Write config, creating it user read/write only so the credentials are
+    # never readable by others, even briefly
     config = {"email": email, "password": password}
-    with open(config_file, "w") as f:
+    fd = os.open(config_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w") as f:
+        # The mode above only applies to new files; tighten an existing one too
+        # (os.fchmod is missing on Windows before Python 3.13)
+        if hasattr(os, "fchmod"):
+            os.fchmod(fd, 0o600)
         json.dump(config, f, indent=2)
 
-    # Set permissions
-    os.chmod(config_file, 0o600)
-
     print(f"\n✓ Credentials saved to: {config_file}")
     print("  File permissions: 600 (user read/write only)")
     print("\nYou can now start the MCP server with: paprika-mcp")
@@ -1,17 +1,23 @@
 """Prompts module - exports all MCP prompt implementations."""
 
+from typing import Any
+
 from .user_preferences import PROMPT_DEFINITION as USER_PREFS_DEF
 from .user_preferences import user_preferences_prompt
 
 # Export all prompts and their definitions
-PROMPTS = {
+PROMPTS: dict[str, dict[str, Any]] = {
     "user_preferences": {
         "definition": USER_PREFS_DEF,
         "handler": user_preferences_prompt,
     },
 }
 
+# Flat name -> handler mapping for dispatching prompt requests
+PROMPT_HANDLERS = {name: prompt["handler"] for name, prompt in PROMPTS.items()}
+
 __all__ = [
     "PROMPTS",
+    "PROMPT_HANDLERS",
     "user_preferences_prompt",
 ]
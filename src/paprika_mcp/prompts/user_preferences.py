@@ -5,12 +5,15 @@ from typing import Any
 
 from mcp.types import GetPromptResult, PromptMessage, TextContent
 
+# Resolved once at import; the home directory doesn't change for the server lifetime
+_PROMPT_PATH = Path.home() / ".paprika-mcp" / "prompt.md"
+
 
 async def user_preferences_prompt(args: dict[str, Any]) -> GetPromptResult:
     """Load user preferences from ~/.paprika-mcp/prompt.md."""
-    prompt_path = Path.home() / ".paprika-mcp" / "prompt.md"
-
-    if not prompt_path.exists():
+    try:
+        content = _PROMPT_PATH.read_text(encoding="utf-8")
+    except FileNotFoundError:
         return GetPromptResult(
             description="User preferences not configured",
             messages=[
@@ -23,17 +26,6 @@ async def user_preferences_prompt(args: dict[str, Any]) -> GetPromptResult:
                 )
             ],
         )
-
-    try:
-        content = prompt_path.read_text()
-        return GetPromptResult(
-            description="User preferences and context",
-            messages=[
-                PromptMessage(
-                    role="user", content=TextContent(type="text", text=content)
-                )
-            ],
-        )
     except Exception as e:
         return GetPromptResult(
             description="Error loading user preferences",
@@ -48,6 +40,13 @@ async def user_preferences_prompt(args: dict[str, Any]) -> GetPromptResult:
             ],
         )
 
+    return GetPromptResult(
+        description="User preferences and context",
+        messages=[
+            PromptMessage(role="user", content=TextContent(type="text", text=content))
+        ],
+    )
+
 
 # Prompt definition
 PROMPT_DEFINITION = {
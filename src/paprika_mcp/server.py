@@ -7,47 +7,53 @@ from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Prompt, Tool
 
-from .prompts import PROMPTS
-from .tools import TOOLS
+from .prompts import PROMPT_HANDLERS, PROMPTS
+from .tools import TOOL_HANDLERS, TOOLS
 
 logger = logging.getLogger(__name__)
 
 # Create server instance
 app = Server("paprika")
 
+# Definitions are static, so build the protocol models once
+_PROMPT_LIST = [Prompt(**prompt["definition"]) for prompt in PROMPTS.values()]
+_TOOL_LIST = [Tool(**tool["definition"]) for tool in TOOLS.values()]
+
 
 @app.list_prompts()
 async def list_prompts():
     """List available prompts."""
-    return [Prompt(**prompt["definition"]) for prompt in PROMPTS.values()]
+    return _PROMPT_LIST
 
 
 @app.get_prompt()
 async def get_prompt(name: str, arguments: dict = None):
     """Get prompt content."""
-    if name in PROMPTS:
-        return await PROMPTS[name]["handler"](arguments or {})
-    raise ValueError(f"Unknown prompt: {name}")
+    handler = PROMPT_HANDLERS.get(name)
+    if handler is None:
+        raise ValueError(f"Unknown prompt: {name}")
+    return await handler(arguments or {})
 
 
 @app.list_tools()
 async def list_tools():
     """List available tools."""
-    return [Tool(**tool["definition"]) for tool in TOOLS.values()]
+    return _TOOL_LIST
 
 
 @app.call_tool()
 async def call_tool(name: str, arguments: dict):
     """Handle tool calls."""
-    if name in TOOLS:
-        try:
-            return await TOOLS[name]["handler"](arguments)
-        except Exception as e:
-            logger.error(f"Error in {name}: {e}", exc_info=True)
-            from mcp.types import TextContent
-
-            return [TextContent(type="text", text=f"Error: {str(e)}")]
-    raise ValueError(f"Unknown tool: {name}")
+    handler = TOOL_HANDLERS.get(name)
+    if handler is None:
+        raise ValueError(f"Unknown tool: {name}")
+    try:
+        return await handler(arguments)
+    except Exception as e:
+        logger.error(f"Error in {name}: {e}", exc_info=True)
+        from mcp.types import TextContent
+
+        return [TextContent(type="text", text=f"Error: {str(e)}")]
 
 
 async def main():
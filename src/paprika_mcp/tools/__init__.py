@@ -1,5 +1,7 @@
 """Tools module - exports all MCP tool implementations."""
 
+from typing import Any
+
 from .format_fraction import TOOL_DEFINITION as FORMAT_FRACTION_DEF
 from .format_fraction import format_fraction_tool
 from .list_categories import TOOL_DEFINITION as LIST_CATEGORIES_DEF
@@ -12,7 +14,7 @@ from .update_recipe import TOOL_DEFINITION as UPDATE_RECIPE_DEF
 from .update_recipe import update_recipe_tool
 
 # Export all tools and their definitions
-TOOLS = {
+TOOLS: dict[str, dict[str, Any]] = {
     "search_recipes": {
         "definition": SEARCH_RECIPES_DEF,
         "handler": search_recipes_tool,
@@ -35,8 +37,12 @@ TOOLS = {
     },
 }
 
+# Flat name -> handler mapping for dispatching tool calls
+TOOL_HANDLERS = {name: tool["handler"] for name, tool in TOOLS.items()}
+
 __all__ = [
     "TOOLS",
+    "TOOL_HANDLERS",
     "search_recipes_tool",
     "read_recipe_tool",
     "update_recipe_tool",
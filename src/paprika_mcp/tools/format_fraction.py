@@ -1,10 +1,52 @@
 """Format fraction tool - converts fractions to Unicode characters."""
 
-import unicodedata
 from typing import Any
 
 from mcp.types import TextContent
 
+# Characters that only appear in already-formatted fractions: the dedicated
+# vulgar fraction codepoints (U+00BC-00BE, U+2150-215E, U+2189), the fraction
+# slash (U+2044), and the superscript/subscript digits used to compose others
+_UNICODE_FRACTION_CHARS = frozenset("¼½¾⅐⅑⅒⅓⅔⅕⅖⅗⅘⅙⅚⅛⅜⅝⅞↉\u2044⁰¹²³⁴⁵⁶⁷⁸⁹₀₁₂₃₄₅₆₇₈₉")
+
+# Map of common fractions to their unicode characters
+_COMMON_FRACTIONS = {
+    "1/4": "¼",
+    "1/2": "½",
+    "3/4": "¾",
+    "1/7": "⅐",
+    "1/9": "⅑",
+    "1/10": "⅒",
+    "1/3": "⅓",
+    "2/3": "⅔",
+    "1/5": "⅕",
+    "2/5": "⅖",
+    "3/5": "⅗",
+    "4/5": "⅘",
+    "1/6": "⅙",
+    "5/6": "⅚",
+    "1/8": "⅛",
+    "3/8": "⅜",
+    "5/8": "⅝",
+    "7/8": "⅞",
+}
+
+# Translation tables for composing fractions that have no dedicated character
+_SUPERSCRIPT_DIGITS = str.maketrans("0123456789", "⁰¹²³⁴⁵⁶⁷⁸⁹")
+_SUBSCRIPT_DIGITS = str.maketrans("0123456789", "₀₁₂₃₄₅₆₇₈₉")
+_FRACTION_SLASH = "\u2044"  # U+2044 FRACTION SLASH
+
+
+def _is_integer(text: str) -> bool:
+    """Check whether int() accepts text, skipping the call for plain digits."""
+    if text.isdecimal():
+        return True
+    try:
+        int(text)
+    except ValueError:
+        return False
+    return True
+
 
 def format_fraction(fraction_str: str) -> str:
     """Format a fraction string to unicode fraction characters.
@@ -18,66 +60,39 @@ def format_fraction(fraction_str: str) -> str:
     # Strip whitespace
     fraction_str = fraction_str.strip()
 
+    # Check if it's a common fraction first - the usual case for typed input
+    if fraction_str in _COMMON_FRACTIONS:
+        return _COMMON_FRACTIONS[fraction_str]
+
     # Check if it's already a unicode fraction - if so, return as-is
-    # Unicode fractions are in these ranges:
-    # U+00BC-00BE (¼ ½ ¾)
-    # U+2150-215E (various fractions)
-    # Also check for composed fractions (superscript + U+2044 + subscript)
-    if any(unicodedata.category(c) in ("No",) or c == "\u2044" for c in fraction_str):
-        return fraction_str
-
-    # Map of common fractions to their unicode characters
-    common_fractions = {
-        "1/4": "¼",
-        "1/2": "½",
-        "3/4": "¾",
-        "1/7": "⅐",
-        "1/9": "⅑",
-        "1/10": "⅒",
-        "1/3": "⅓",
-        "2/3": "⅔",
-        "1/5": "⅕",
-        "2/5": "⅖",
-        "3/5": "⅗",
-        "4/5": "⅘",
-        "1/6": "⅙",
-        "5/6": "⅚",
-        "1/8": "⅛",
-        "3/8": "⅜",
-        "5/8": "⅝",
-        "7/8": "⅞",
-    }
-
-    # Check if it's a common fraction
-    if fraction_str in common_fractions:
-        return common_fractions[fraction_str]
+    # (pure ASCII input can't contain any of those characters)
+    if not fraction_str.isascii():
+        if not _UNICODE_FRACTION_CHARS.isdisjoint(fraction_str):
+            return fraction_str
 
     # Parse the fraction
-    if "/" not in fraction_str:
+    numerator, slash, denominator = fraction_str.partition("/")
+    if not slash:
         raise ValueError("Fraction must contain a '/' character")
-
-    parts = fraction_str.split("/")
-    if len(parts) != 2:
+    if "/" in denominator:
         raise ValueError("Fraction must be in the form 'numerator/denominator'")
 
-    numerator, denominator = parts
+    numerator, denominator = numerator.strip(), denominator.strip()
 
-    # Validate that both parts are numbers
-    try:
-        int(numerator)
-        int(denominator)
-    except ValueError as e:
-        raise ValueError("Numerator and denominator must be integers") from e
+    # Validate that both parts are numbers (the values themselves are never used)
+    if not (_is_integer(numerator) and _is_integer(denominator)):
+        raise ValueError("Numerator and denominator must be integers")
 
-    # Build using superscript + fraction slash + subscript
-    superscript_digits = str.maketrans("0123456789", "⁰¹²³⁴⁵⁶⁷⁸⁹")
-    subscript_digits = str.maketrans("0123456789", "₀₁₂₃₄₅₆₇₈₉")
+    # Spaces around the slash (e.g. "1 / 2") hid a common fraction above
+    common = _COMMON_FRACTIONS.get(f"{numerator}/{denominator}")
+    if common:
+        return common
 
-    superscript_num = numerator.translate(superscript_digits)
-    subscript_den = denominator.translate(subscript_digits)
-    fraction_slash = "\u2044"  # U+2044 FRACTION SLASH
+    # Build using superscript + fraction slash + subscript
+    superscript_num = numerator.translate(_SUPERSCRIPT_DIGITS)
+    subscript_den = denominator.translate(_SUBSCRIPT_DIGITS)
 
-    return f"{superscript_num}{fraction_slash}{subscript_den}"
+    return f"{superscript_num}{_FRACTION_SLASH}{subscript_den}"
 
 
 async def format_fraction_tool(args: dict[str, Any]) -> list[TextContent]:
@@ -12,26 +12,24 @@ async def list_categories_tool(args: dict[str, Any]) -> list[TextContent]:
     # Get the remote to access bearer token
     remote = get_remote()
 
-    # Fetch categories using cached utility
+    # Fetch categories using cached utility (already sorted by name)
     categories_data = get_categories(remote.bearer_token)
     categories = categories_data["all"]
 
     if not categories:
         return [TextContent(type="text", text="No categories found")]
 
-    # Sort categories by name
-    categories.sort(key=lambda c: c.get("name", "").lower())
-
-    # Build hierarchical structure
+    # Build hierarchical structure. Categories are already sorted, so each
+    # parent's children end up in name order without sorting them again.
     root_categories = []
     child_categories = {}
+    categories_by_uid = {}
 
     for cat in categories:
+        categories_by_uid[cat["uid"]] = cat
         parent_uid = cat.get("parent_uid")
         if parent_uid:
-            if parent_uid not in child_categories:
-                child_categories[parent_uid] = []
-            child_categories[parent_uid].append(cat)
+            child_categories.setdefault(parent_uid, []).append(cat)
         else:
             root_categories.append(cat)
 
@@ -39,30 +37,18 @@ async def list_categories_tool(args: dict[str, Any]) -> list[TextContent]:
     output_lines = [f"Found {len(categories)} categories:\n"]
 
     def format_category(cat, indent=0):
-        """Recursively format a category and its children."""
-        lines = []
-        prefix = "  " * indent
-        name = cat.get("name", "Unnamed")
-        uid = cat["uid"]
-        lines.append(f"{prefix}- {name}")
-
-        # Add children
-        if uid in child_categories:
-            for child in sorted(
-                child_categories[uid], key=lambda c: c.get("name", "").lower()
-            ):
-                lines.extend(format_category(child, indent + 1))
-
-        return lines
+        """Recursively append a category and its children to the output."""
+        output_lines.append(f"{'  ' * indent}- {cat.get('name', 'Unnamed')}")
+        for child in child_categories.get(cat["uid"], ()):
+            format_category(child, indent + 1)
 
     # Format root categories and their children
     output_lines.append("## Hierarchical View:")
     for cat in root_categories:
-        output_lines.extend(format_category(cat))
+        format_category(cat)
 
     # Also add a flat list at the end for easy reference
     output_lines.append("\n## Flat List (for reference):")
-    categories_by_uid = {c["uid"]: c for c in categories}
     for cat in categories:
         name = cat.get("name", "Unnamed")
         parent_uid = cat.get("parent_uid")
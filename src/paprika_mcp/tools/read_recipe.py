@@ -1,10 +1,31 @@
 """Read recipe tool - retrieves full recipe data."""
 
+import io
 from typing import Any
 
 from mcp.types import TextContent
 
-from ..utils import get_remote, normalize_string, translate_category_uids
+from ..utils import get_recipes, get_remote, normalize_string, translate_category_uids
+
+# Optional fields in display order, mapped to the text written before their
+# value. Sections get a "## Title" heading line; the rest render inline as
+# "**Title:** value". Each prefix starts with the blank line between fields.
+_FIELD_PREFIXES = {
+    "description": "\n\n## Description\n",
+    "categories": "\n\n## Categories\n",
+    "source": "\n\n## Source\n",
+    "source_url": "\n\n## Source URL\n",
+    "prep_time": "\n\n**Prep Time:** ",
+    "cook_time": "\n\n**Cook Time:** ",
+    "total_time": "\n\n**Total Time:** ",
+    "servings": "\n\n**Servings:** ",
+    "difficulty": "\n\n**Difficulty:** ",
+    "rating": "\n\n**Rating:** ",
+    "ingredients": "\n\n## Ingredients\n",
+    "directions": "\n\n## Directions\n",
+    "notes": "\n\n## Notes\n",
+    "nutritional_info": "\n\n## Nutritional Info\n",
+}
 
 
 async def read_recipe_tool(args: dict[str, Any]) -> list[TextContent]:
@@ -20,15 +41,11 @@ async def read_recipe_tool(args: dict[str, Any]) -> list[TextContent]:
 
     # Get the remote
     remote = get_remote()
+    recipes = get_recipes(remote)
 
     # If we have an ID, use it directly
     if recipe_id:
-        # Need to get all recipes first to find the hash
-        recipe = None
-        for r in remote.recipes:
-            if r.uid == recipe_id:
-                recipe = r
-                break
+        recipe = recipes["by_uid"].get(recipe_id)
         if not recipe:
             return [
                 TextContent(
@@ -37,21 +54,8 @@ async def read_recipe_tool(args: dict[str, Any]) -> list[TextContent]:
                 )
             ]
     else:
-        # Search by title
-        # NOTE: This is not optimal - ideally we'd cache the recipe list
-        # and search through it, but for now we fetch all recipes
-        all_recipes = remote.recipes
-
-        # Normalize the search title
-        normalized_search = normalize_string(recipe_title)
-
-        # Find matching recipe
-        recipe = None
-        for r in all_recipes:
-            if normalize_string(r.name) == normalized_search:
-                recipe = r
-                break
-
+        # Search by title (names are indexed in normalized form)
+        recipe = recipes["by_name"].get(normalize_string(recipe_title))
         if not recipe:
             return [
                 TextContent(
@@ -60,94 +64,35 @@ async def read_recipe_tool(args: dict[str, Any]) -> list[TextContent]:
                 )
             ]
 
-    # Define all available fields and their formatters
     # Translate category UUIDs to names
     category_names = translate_category_uids(
         recipe.categories or [], remote.bearer_token
     )
 
-    all_fields = {
-        "name": lambda: [f"# {recipe.name}"],
-        "uid": lambda: [f"**UID:** {recipe.uid}"],
-        "description": lambda: (
-            ["", "## Description", recipe.description] if recipe.description else []
-        ),
-        "categories": lambda: (
-            ["", "## Categories", category_names] if category_names else []
-        ),
-        "source": lambda: ["", "## Source", recipe.source] if recipe.source else [],
-        "source_url": lambda: (
-            ["", "## Source URL", recipe.source_url] if recipe.source_url else []
-        ),
-        "prep_time": lambda: (
-            ["", f"**Prep Time:** {recipe.prep_time}"] if recipe.prep_time else []
-        ),
-        "cook_time": lambda: (
-            ["", f"**Cook Time:** {recipe.cook_time}"] if recipe.cook_time else []
-        ),
-        "total_time": lambda: (
-            ["", f"**Total Time:** {recipe.total_time}"] if recipe.total_time else []
-        ),
-        "servings": lambda: (
-            ["", f"**Servings:** {recipe.servings}"] if recipe.servings else []
-        ),
-        "difficulty": lambda: (
-            ["", f"**Difficulty:** {recipe.difficulty}"] if recipe.difficulty else []
-        ),
-        "rating": lambda: ["", f"**Rating:** {recipe.rating}"] if recipe.rating else [],
-        "ingredients": lambda: (
-            ["", "## Ingredients", recipe.ingredients] if recipe.ingredients else []
-        ),
-        "directions": lambda: (
-            ["", "## Directions", recipe.directions] if recipe.directions else []
-        ),
-        "notes": lambda: ["", "## Notes", recipe.notes] if recipe.notes else [],
-        "nutritional_info": lambda: (
-            ["", "## Nutritional Info", recipe.nutritional_info]
-            if recipe.nutritional_info
-            else []
-        ),
-    }
-
     # Always include name and uid
-    output_lines = []
-    output_lines.extend(all_fields["name"]())
-    output_lines.append("")
-    output_lines.extend(all_fields["uid"]())
-
-    # Determine which fields to include
-    if requested_fields:
-        # Filter to requested fields (excluding name and uid which are always included)
-        fields_to_include = [
-            f for f in requested_fields if f in all_fields and f not in ["name", "uid"]
-        ]
-    else:
-        # Include all fields
-        fields_to_include = [f for f in all_fields.keys() if f not in ["name", "uid"]]
-
-    # Add requested fields in their defined order
-    field_order = [
-        "description",
-        "categories",
-        "source",
-        "source_url",
-        "prep_time",
-        "cook_time",
-        "total_time",
-        "servings",
-        "difficulty",
-        "rating",
-        "ingredients",
-        "directions",
-        "notes",
-        "nutritional_info",
-    ]
-
-    for field_name in field_order:
-        if field_name in fields_to_include:
-            output_lines.extend(all_fields[field_name]())
-
-    return [TextContent(type="text", text="\n".join(output_lines))]
+    output = io.StringIO()
+    write = output.write
+    write(f"# {recipe.name}\n\n**UID:** {recipe.uid}")
+
+    # Filter to requested fields if specified (name and uid are always included)
+    requested = set(requested_fields) if requested_fields else None
+
+    # Add fields in their defined order
+    for field_name, prefix in _FIELD_PREFIXES.items():
+        if requested is not None and field_name not in requested:
+            continue
+
+        if field_name == "categories":
+            value = category_names
+        else:
+            value = getattr(recipe, field_name)
+        if not value:
+            continue
+
+        write(prefix)
+        write(str(value))
+
+    return [TextContent(type="text", text=output.getvalue())]
 
 
 # Tool definition
@@ -1,14 +1,63 @@
 """Search recipes tool - searches recipe text by keyword."""
 
+import asyncio
+import re
 from typing import Any
 
 from mcp.types import TextContent
 
-from ..utils import get_categories, get_remote, search_in_text, translate_category_uids
+from ..utils import (
+    compile_pattern,
+    find_in_column,
+    find_in_text,
+    get_categories,
+    get_recipes,
+    get_remote,
+    matches_by_line,
+    search_in_column,
+    search_in_text,
+)
+
+# Searchable fields, in the order results are reported for each recipe
+_SEARCH_FIELDS = ("name", "ingredients", "categories", "directions", "notes")
+
+
+def _search_field(
+    text: str,
+    text_lower: str | None,
+    pattern: re.Pattern[str] | str,
+    context_lines: int,
+    max_matches: int | None = None,
+) -> list[dict[str, Any]]:
+    """Search one field's text with the query prepared by _do_search."""
+    if isinstance(pattern, str):
+        return find_in_text(
+            text, pattern, context_lines, text_lower=text_lower, max_matches=max_matches
+        )
+    return search_in_text(text, pattern, context_lines, max_matches=max_matches)
+
+
+def _no_results(query: str, category_filter: str | None) -> list[TextContent]:
+    """Build the response for a search that matched nothing."""
+    query_text = query if query else "(empty query)"
+    category_text = f" in category '{category_filter}'" if category_filter else ""
+    return [
+        TextContent(
+            type="text",
+            text=f"No recipes found matching '{query_text}'{category_text}",
+        )
+    ]
 
 
 async def search_recipes_tool(args: dict[str, Any]) -> list[TextContent]:
     """Search recipes by text across multiple fields."""
+    # Fetching and scanning recipes both block, so search in a worker thread
+    # to keep the server responsive to other requests meanwhile
+    return await asyncio.to_thread(_do_search, args)
+
+
+def _do_search(args: dict[str, Any]) -> list[TextContent]:
+    """Run a search for search_recipes_tool."""
     query = args["query"]
     fields = args.get("fields", None)
     context_lines = args.get("context_lines", 2)
@@ -17,89 +66,131 @@ async def search_recipes_tool(args: dict[str, Any]) -> list[TextContent]:
     regex = args.get("regex", False)
     category_filter = args.get("category", None)
 
+    # Prepare the query once for every recipe and field searched below: plain
+    # text is matched case-insensitively as a lowercase substring
+    pattern: re.Pattern[str] | str | None = None
+    if query and not regex:
+        pattern = query.lower()
+    elif query:
+        try:
+            pattern = compile_pattern(query, re.IGNORECASE | re.MULTILINE)
+        except re.error as e:
+            return [
+                TextContent(
+                    type="text",
+                    text=f"Error: Invalid regex pattern '{query}': {str(e)}",
+                )
+            ]
+
     # Get the remote
     remote = get_remote()
 
-    # Fetch all recipes (excluding trashed) and sort alphabetically
-    all_recipes = [r for r in remote.recipes if not r.in_trash]
-    all_recipes.sort(key=lambda r: r.name.lower())
-
     # Get category mappings for translating UUIDs to names
     categories_data = get_categories(remote.bearer_token)
     category_name_to_uid = categories_data["name_to_uid"]
+    uid_to_name = categories_data["uid_to_name"]
 
-    results = []
+    # Resolve the category filter by name (case-insensitive) once up front; an
+    # unknown category can't match anything, so skip fetching recipes at all
+    category_uid = None
+    if category_filter:
+        category_uid = category_name_to_uid.get(category_filter.lower())
+        if not category_uid:
+            return _no_results(query, category_filter)
 
-    for recipe in all_recipes:
-        # Filter by category if specified
-        if category_filter:
-            # Try to match by category name (case-insensitive)
-            category_uid = category_name_to_uid.get(category_filter.lower())
-            if category_uid:
-                # Match by resolved UID
-                if category_uid not in (recipe.categories or []):
-                    continue
-            else:
-                # No matching category name found, skip this recipe
-                continue
+    # Get the cached recipes (excluding trashed, sorted alphabetically)
+    recipes = get_recipes(remote)
+    active_recipes = recipes["active"]
+    columns = recipes["fields"]
+    recipe_categories = recipes["categories"]
+    category_sets = recipes["category_sets"]
 
-        # Translate category UUIDs to names for searching
-        category_names = translate_category_uids(
-            recipe.categories or [], remote.bearer_token
-        )
+    # Pick the fields to search once, in order, with their cached text and
+    # lowercased text columns. Categories have no cached columns (None) since
+    # they're translated to names per recipe.
+    lower_columns = recipes["fields_lower"]
+    active_fields = [
+        (field_name, columns.get(field_name), lower_columns.get(field_name))
+        for field_name in _SEARCH_FIELDS
+        if not fields or field_name in fields
+    ]
+    search_categories = any(column is None for _, column, _ in active_fields)
 
-        # Determine which fields to search
-        searchable_fields = {
-            "name": recipe.name,
-            "ingredients": recipe.ingredients,
-            "categories": category_names,  # Now using translated names
-            "directions": recipe.directions,
-            "notes": recipe.notes or "",
-        }
-
-        # Filter to requested fields if specified
-        if fields:
-            searchable_fields = {
-                k: v for k, v in searchable_fields.items() if k in fields
-            }
+    # Scan each cached column once, with every recipe's text joined into one
+    # string, to find the recipes that may match in that field. Unless
+    # categories are searched too, no other recipe can match at all.
+    column_hits: list[set[int]] | None = None
+    candidates = None
+    if isinstance(pattern, str):
+        joined_columns = recipes["fields_lower_joined"]
+        column_hits = [
+            set() if column is None else find_in_column(joined_columns[name], pattern)
+            for name, column, _ in active_fields
+        ]
+    elif pattern is not None and matches_by_line(pattern):
+        joined_columns = recipes["fields_joined"]
+        column_hits = [
+            set() if column is None else search_in_column(joined_columns[name], pattern)
+            for name, column, _ in active_fields
+        ]
+    if column_hits is not None and not search_categories:
+        candidates = set().union(*column_hits)
+
+    results = []
+
+    for i, recipe in enumerate(active_recipes):
+        if candidates is not None and i not in candidates:
+            continue
+
+        # Filter by category if specified
+        if category_uid and category_uid not in category_sets[i]:
+            continue
 
         # For empty query, match all recipes
-        if not query:
+        if pattern is None:
             results.append(
                 {
                     "recipe_id": recipe.uid,
                     "recipe_title": recipe.name,
                     "field": "all",
-                    "matches": [],
                 }
             )
             continue
 
         # Search each field
-        for field_name, field_text in searchable_fields.items():
+        for j, (field_name, column, lower_column) in enumerate(active_fields):
+            if column is None:
+                # Translate category UUIDs to names for searching (same output
+                # as translate_category_uids, without re-resolving the mappings)
+                field_text = ", ".join(
+                    uid_to_name.get(uid, f"Unknown-{uid[:8]}")
+                    for uid in recipe_categories[i]
+                )
+                text_lower = None
+            elif column_hits is not None and i not in column_hits[j]:
+                continue
+            else:
+                field_text = column[i]
+                text_lower = lower_column[i]
+
             if not field_text:
                 continue
 
-            matches = search_in_text(field_text, query, context_lines, regex=regex)
-            if matches:
+            # Only check that the field matches here; context is gathered
+            # below for the page being shown, not for every result
+            if _search_field(field_text, text_lower, pattern, 0, max_matches=1):
                 results.append(
                     {
                         "recipe_id": recipe.uid,
                         "recipe_title": recipe.name,
                         "field": field_name,
-                        "matches": matches,
+                        "text": field_text,
+                        "text_lower": text_lower,
                     }
                 )
 
     if not results:
-        query_text = query if query else "(empty query)"
-        category_text = f" in category '{category_filter}'" if category_filter else ""
-        return [
-            TextContent(
-                type="text",
-                text=f"No recipes found matching '{query_text}'{category_text}",
-            )
-        ]
+        return _no_results(query, category_filter)
 
     # Count unique recipes
     unique_recipes = len({r["recipe_id"] for r in results})
@@ -123,11 +214,15 @@ async def search_recipes_tool(args: dict[str, Any]) -> list[TextContent]:
         output_lines.append(
             f"\n## {result['recipe_title']} (ID: {result['recipe_id']})"
         )
-        if result["field"] != "all":
-            output_lines.append(f"Field: {result['field']}")
-            output_lines.append("Matches:")
-            for match in result["matches"]:
-                output_lines.append(f"  Line {match['line']}: {match['context']}")
+        # Results for an empty query (field "all") have no matches to show
+        if pattern is not None:
+            matches = _search_field(
+                result["text"], result["text_lower"], pattern, context_lines
+            )
+            output_lines.append(f"Field: {result['field']}\nMatches:")
+            output_lines.extend(
+                f"  Line {match['line']}: {match['context']}" for match in matches
+            )
 
     if page < total_pages:
         output_lines.append(
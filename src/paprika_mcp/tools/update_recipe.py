@@ -5,7 +5,7 @@ from typing import Any
 
 from mcp.types import TextContent
 
-from ..utils import get_remote
+from ..utils import compile_pattern, get_remote, invalidate_recipes_cache
 
 
 async def update_recipe_tool(args: dict[str, Any]) -> list[TextContent]:
@@ -19,12 +19,10 @@ async def update_recipe_tool(args: dict[str, Any]) -> list[TextContent]:
     # Get the remote
     remote = get_remote()
 
-    # Fetch the recipe
-    recipe = None
-    for r in remote.recipes:
-        if r.uid == recipe_id:
-            recipe = r
-            break
+    # Fetch the recipe fresh rather than from the recipe cache, so the upload
+    # doesn't overwrite edits made elsewhere with a stale copy. Stop at the
+    # first match instead of rebuilding the whole cache.
+    recipe = next((r for r in remote.recipes if r.uid == recipe_id), None)
 
     if not recipe:
         return [
@@ -45,10 +43,10 @@ async def update_recipe_tool(args: dict[str, Any]) -> list[TextContent]:
             )
         ]
 
-    # Perform the find/replace
+    # Perform the find/replace, noting whether the pattern was found at all
     if use_regex:
         try:
-            new_value = re.sub(find, replace, field_value)
+            new_value, found = compile_pattern(find).subn(replace, field_value)
         except re.error as e:
             return [
                 TextContent(
@@ -56,10 +54,11 @@ async def update_recipe_tool(args: dict[str, Any]) -> list[TextContent]:
                 )
             ]
     else:
-        new_value = field_value.replace(find, replace)
+        found = find in field_value
+        new_value = field_value.replace(find, replace) if found else field_value
 
-    # Check if anything changed
-    if new_value == field_value:
+    # Check if anything changed (a match can be replaced with the same text)
+    if not found or new_value == field_value:
         return [
             TextContent(
                 type="text",
@@ -67,8 +66,11 @@ async def update_recipe_tool(args: dict[str, Any]) -> list[TextContent]:
             )
         ]
 
-    # Update the field
+    # Update the field, and drop the cached recipes so the next search or read
+    # doesn't serve the old text (kept simple: whether or not the upload below
+    # succeeds)
     setattr(recipe, field, new_value)
+    invalidate_recipes_cache()
 
     # Save the recipe
     try:
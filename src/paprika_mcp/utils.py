@@ -3,17 +3,67 @@
 import json
 import logging
 import os
+import re
+import threading
+import time
 import unicodedata
-from typing import Any
+from bisect import bisect_right
+from collections.abc import Callable
+from functools import lru_cache
+from itertools import accumulate
+from typing import TYPE_CHECKING, Any
 
-import requests
-from paprika_recipes.cache import DirectoryCache
-from paprika_recipes.remote import Remote
+if TYPE_CHECKING:
+    from paprika_recipes.remote import Remote
+
+# requests and paprika_recipes are imported inside the functions that use them,
+# so starting the server (and listing tools) doesn't pay for loading them
 
 logger = logging.getLogger(__name__)
 
-# Module-level cache for categories (persists for server lifetime)
+# Module-level cache for categories (refreshed after _CATEGORIES_CACHE_TTL
+# seconds)
 _categories_cache: dict[str, dict[str, str]] | None = None
+_categories_cache_time = 0.0
+
+# Module-level cache for recipes (refreshed after _RECIPES_CACHE_TTL seconds)
+_recipes_cache: dict[str, Any] | None = None
+_recipes_cache_time = 0.0
+
+# Bumped by invalidate_recipes_cache(). Searches build the cache on worker
+# threads, so a build that started before an invalidation must not store its
+# (possibly stale) result; the lock makes that check and the store atomic.
+_recipes_cache_generation = 0
+_recipes_cache_lock = threading.Lock()
+
+# Recipes and categories can be edited in the Paprika apps while the server is
+# running, so they are only reused for a few minutes
+_CATEGORIES_CACHE_TTL = 300
+_RECIPES_CACHE_TTL = 300
+
+# Separates the records of a joined column (see join_column). A line break
+# means ^ and $ (with re.MULTILINE) still match at the start and end of each
+# record.
+_RECORD_SEPARATOR = "\n"
+
+# Regex syntax that can't match a line break and matches the same way in a
+# line on its own as within the text around it (see matches_by_line).
+# Anything else falls back to matching line by line: e.g. \A and \Z,
+# lookarounds, possessive quantifiers, atomic groups, comments, turning flags
+# off, and whatever can match a line break, such as \s, \S, \D, \W, negated
+# classes and the s flag.
+_LINE_LOCAL = re.compile(
+    r"""
+    (?:
+        \\(?:[dwbBtrfv]|[1-9](?!\d)|[^\w\s])       # escapes and backreferences
+      | \[(?!\^)\]?(?:\\(?:[dw]|[^\w\s])|[^\]\\\x00-\x1f])*\]  # plain classes
+      | \((?:\?(?::|P<\w+>|P=\w+\)|[aimu]+[):])|(?!\?))  # groups, flags on
+      | (?:[*+?]|\{\d*(?:,\d*)?\})\??(?!\+)         # greedy/lazy quantifiers
+      | [^\\\[(*+?{\n]                              # literals, ) | ^ $ . etc.
+    )*
+    """,
+    re.VERBOSE,
+)
 
 
 def get_credentials() -> tuple[str, str]:
@@ -86,7 +136,7 @@ def get_user_agent() -> str | None:
     return None
 
 
-def get_remote() -> Remote:
+def get_remote() -> "Remote":
     """Get authenticated Remote instance using stored credentials.
 
     The Remote class uses a DirectoryCache to store recipe data locally:
@@ -104,6 +154,9 @@ def get_remote() -> Remote:
         PaprikaError: If authentication fails (check credentials)
         RequestError: If API request fails (network/server issue)
     """
+    from paprika_recipes.cache import DirectoryCache
+    from paprika_recipes.remote import Remote
+
     email, password = get_credentials()
     user_agent = get_user_agent()
 
@@ -128,23 +181,201 @@ def get_remote() -> Remote:
         raise
 
 
+def get_recipes(remote: "Remote", refresh: bool = False) -> dict[str, Any]:
+    """Get all recipes with lookup indexes, cached for a short time.
+
+    Returns a dict with:
+    - 'all': list of all recipes (including trashed)
+    - 'by_uid': mapping of UID to recipe
+    - 'by_name': mapping of normalized name (see normalize_string) to recipe
+    - 'active': list of non-trashed recipes, sorted by name (case-insensitive)
+    - 'fields': mapping of searchable field name ('name', 'ingredients',
+      'directions', 'notes') to a list of that field's text for each recipe
+      in 'active' (None is stored as "")
+    - 'fields_lower': the same columns lowercased, for plain text searches
+    - 'fields_joined': each column joined into one string, for regex searches
+      (see join_column, find_in_column and search_in_column)
+    - 'fields_lower_joined': the same for the lowercased columns
+    - 'categories': list of category UUID lists, aligned with 'active'
+    - 'category_sets': the same as frozensets, for filtering by category
+
+    Walking remote.recipes fetches the recipe list from the API every time,
+    so the materialized result is reused for _RECIPES_CACHE_TTL seconds.
+    Pass refresh=True to rebuild it regardless, and call
+    invalidate_recipes_cache() after uploading a change.
+    """
+    global _recipes_cache, _recipes_cache_time
+
+    now = time.monotonic()
+    if (
+        not refresh
+        and _recipes_cache is not None
+        and now - _recipes_cache_time < _RECIPES_CACHE_TTL
+    ):
+        return _recipes_cache
+
+    generation = _recipes_cache_generation
+    all_recipes = list(remote.recipes)
+
+    # Normalize names once here so title lookups are a single dict hit
+    by_name: dict[str, Any] = {}
+    for r in all_recipes:
+        # Keep the first recipe when several share a name
+        by_name.setdefault(_normalize_name(r.name), r)
+
+    # Searchable text is kept as parallel columns so searches can scan it
+    # without going through the recipe objects. Sorting here means searches
+    # can list results alphabetically without sorting on every call.
+    active = [r for r in all_recipes if not r.in_trash]
+    active.sort(key=lambda r: (r.name or "").lower())
+    fields = {
+        "name": [r.name or "" for r in active],
+        "ingredients": [r.ingredients or "" for r in active],
+        "directions": [r.directions or "" for r in active],
+        "notes": [r.notes or "" for r in active],
+    }
+
+    fields_lower = {
+        name: [text.lower() for text in column] for name, column in fields.items()
+    }
+
+    recipes = {
+        "all": all_recipes,
+        "by_uid": {r.uid: r for r in all_recipes},
+        "by_name": by_name,
+        "active": active,
+        "fields": fields,
+        # Lowercased once here rather than on every search
+        "fields_lower": fields_lower,
+        "fields_joined": {name: join_column(column) for name, column in fields.items()},
+        "fields_lower_joined": {
+            name: join_column(column) for name, column in fields_lower.items()
+        },
+        "categories": [r.categories or [] for r in active],
+        "category_sets": [frozenset(r.categories or ()) for r in active],
+    }
+
+    with _recipes_cache_lock:
+        if generation == _recipes_cache_generation:
+            _recipes_cache = recipes
+            _recipes_cache_time = now
+
+    return recipes
+
+
+def join_column(texts: list[str]) -> tuple[str, list[int]]:
+    """Join a column of texts into one string for find/search_in_column.
+
+    Returns the joined string and the offset where each record starts, plus
+    one final entry past the end.
+    """
+    starts = list(accumulate((len(text) + 1 for text in texts), initial=0))
+    return _RECORD_SEPARATOR.join(texts), starts
+
+
+def _column_hits(column: tuple[str, list[int]], find: Callable[[int], int]) -> set[int]:
+    """Get the indexes of the records in a joined column holding a hit.
+
+    find(pos) returns where the next hit at or after pos starts, or -1.
+    """
+    starts = column[1]
+    hits = set()
+    pos = 0
+    # starts[-1] is past the end of the text (or 0 for an empty column)
+    while pos < starts[-1]:
+        pos = find(pos)
+        if pos == -1:
+            break
+        index = bisect_right(starts, pos) - 1
+        hits.add(index)
+        # Skip the rest of this record
+        pos = starts[index + 1]
+    return hits
+
+
+def find_in_column(column: tuple[str, list[int]], query: str) -> set[int]:
+    """Get the indexes of the records in a joined column that contain query.
+
+    One str.find pass over the joined text replaces a separate search of
+    every record. Like find_in_text, a query spanning a line break never
+    matches, so it can't match across records either.
+    """
+    if "\n" in query:
+        return set()
+    joined = column[0]
+    return _column_hits(column, lambda pos: joined.find(query, pos))
+
+
+def search_in_column(
+    column: tuple[str, list[int]], pattern: re.Pattern[str]
+) -> set[int]:
+    """Get the indexes of the records in a joined column that match pattern.
+
+    One Pattern.search pass over the joined text replaces a separate search
+    of every record. Only use it for patterns that pass matches_by_line:
+    their matches never reach the line break between records, so each one
+    lies within a single record. Patterns that match empty text (e.g. "x*")
+    also report empty records, which search_in_text never matches.
+    """
+    joined = column[0]
+
+    def find(pos: int) -> int:
+        m = pattern.search(joined, pos)
+        return -1 if m is None else m.start()
+
+    return _column_hits(column, find)
+
+
+def matches_by_line(pattern: re.Pattern[str]) -> bool:
+    """Check whether a regex can be run over whole texts instead of each line.
+
+    True if every match it finds within a line is also a match in that line
+    on its own, which search_in_text and search_in_column rely on. Matches
+    never run past the end of a line either, so a scan costs the same as
+    searching each line, however long the text.
+    """
+    if not pattern.flags & re.MULTILINE:
+        return False
+    if pattern.flags & (re.VERBOSE | re.DOTALL):
+        return False
+    return _LINE_LOCAL.fullmatch(pattern.pattern) is not None
+
+
+def invalidate_recipes_cache() -> None:
+    """Drop cached recipes so the next get_recipes() call refetches them.
+
+    Builds already in progress finish, but don't store their result.
+    """
+    global _recipes_cache, _recipes_cache_generation
+    with _recipes_cache_lock:
+        _recipes_cache_generation += 1
+        _recipes_cache = None
+
+
 def get_categories(bearer_token: str) -> dict[str, Any]:
     """Get all categories from Paprika API with caching.
 
     Returns a dict with:
     - 'uid_to_name': mapping of UUID to category name
     - 'name_to_uid': mapping of lowercase name to UUID
-    - 'all': list of all category dicts
+    - 'all': list of all category dicts, sorted by name (case-insensitive)
     - 'by_uid': mapping of UUID to full category dict
 
-    Results are cached for the lifetime of the server process.
+    Results are cached for _CATEGORIES_CACHE_TTL seconds, so most tool calls
+    don't wait on the API.
     """
-    global _categories_cache
+    global _categories_cache, _categories_cache_time
 
     # Return cached version if available
-    if _categories_cache is not None:
+    now = time.monotonic()
+    if (
+        _categories_cache is not None
+        and now - _categories_cache_time < _CATEGORIES_CACHE_TTL
+    ):
         return _categories_cache
 
+    import requests
+
     # Fetch from API
     headers = {"Authorization": f"Bearer {bearer_token}"}
     try:
@@ -157,6 +388,9 @@ def get_categories(bearer_token: str) -> dict[str, Any]:
         data = resp.json()
         categories = data.get("result", [])
 
+        # Sort once here rather than on every list_categories call
+        categories.sort(key=lambda c: c.get("name", "").lower())
+
         # Build mappings
         uid_to_name = {}
         name_to_uid = {}
@@ -176,6 +410,7 @@ def get_categories(bearer_token: str) -> dict[str, Any]:
             "all": categories,
             "by_uid": by_uid,
         }
+        _categories_cache_time = now
 
         return _categories_cache
 
@@ -214,61 +449,195 @@ def normalize_string(text: str) -> str:
     """Normalize unicode string for comparison.
 
     Uses NFD normalization to decompose accented characters,
-    making comparisons work across different unicode representations.
+    making comparisons work across different unicode representations,
+    and casefold() so e.g. "ß" and "ss" compare equal.
+    """
+    return unicodedata.normalize("NFD", text).casefold()
+
+
+# normalize_string for recipe names, which come up again every time the recipe
+# cache is rebuilt. Bounded well above any real library size, so a rebuild
+# never evicts its own names but renamed recipes' old names eventually go.
+_normalize_name = lru_cache(maxsize=65536)(normalize_string)
+
+
+@lru_cache(maxsize=256)
+def compile_pattern(pattern: str, flags: int = 0) -> re.Pattern[str]:
+    """Compile a regex pattern, reusing the compiled object across tool calls.
+
+    Raises:
+        re.error: If the pattern is invalid
     """
-    return unicodedata.normalize("NFD", text).lower()
+    return re.compile(pattern, flags)
+
+
+def _line_context(text: str, begin: int, end: int, context_lines: int) -> str:
+    """Get the line text[begin:end] with up to context_lines lines either side.
+
+    Walks out to the surrounding line breaks, so long texts are never split
+    into lines just to show a few of them.
+    """
+    for _ in range(context_lines):
+        if begin == 0:
+            break
+        begin = text.rfind("\n", 0, begin - 1) + 1
+    for _ in range(context_lines):
+        if end == len(text):
+            break
+        end = text.find("\n", end + 1)
+        if end == -1:
+            end = len(text)
+    return text[begin:end]
+
+
+def _search_lines(
+    text: str, pattern: re.Pattern[str], context_lines: int, max_matches: int | None
+) -> list[dict[str, Any]]:
+    """Search each line of text separately (see search_in_text)."""
+    lines = text.split("\n")
+    matches = []
+    for line_index, line in enumerate(lines):
+        if pattern.search(line):
+            start = max(0, line_index - context_lines)
+            end = min(len(lines), line_index + context_lines + 1)
+            matches.append(
+                {
+                    "line": line_index + 1,
+                    "match": line.strip(),
+                    "context": "\n".join(lines[start:end]),
+                }
+            )
+            if len(matches) == max_matches:
+                break
+    return matches
+
+
+def _collect_matches(
+    text: str,
+    haystack: str,
+    find: Callable[[int], int],
+    context_lines: int,
+    max_matches: int | None,
+) -> list[dict[str, Any]]:
+    """Report the lines of text holding hits, jumping from hit to hit.
+
+    Rather than testing every line, find(pos) returns where the next hit in
+    haystack at or after pos starts (or -1), which runs over the whole text
+    in C; only the line each hit is on is worked out here. haystack is text
+    or a lowercased copy of it, which has the same line breaks. Hits must not
+    span a line break.
+    """
+    # Lowercasing almost never changes the length of text (it can, e.g. for
+    # "İ"), so offsets into the haystack can usually slice text directly.
+    # Otherwise fall back to splitting text into lines.
+    aligned = len(haystack) == len(text)
+
+    matches = []
+    lines: list[str] = []
+    line_index = 0  # line containing line_start
+    line_start = 0
+    pos = 0
+
+    while True:
+        pos = find(pos)
+        if pos == -1:
+            break
+
+        line_index += haystack.count("\n", line_start, pos)
+        line_begin = haystack.rfind("\n", 0, pos) + 1
+        line_end = haystack.find("\n", pos)
+        if line_end == -1:
+            line_end = len(haystack)
+
+        if aligned:
+            line = text[line_begin:line_end]
+        else:
+            if not lines:
+                lines = text.split("\n")
+            line = lines[line_index]
+
+        if aligned:
+            context = _line_context(text, line_begin, line_end, context_lines)
+        else:
+            start = max(0, line_index - context_lines)
+            end = min(len(lines), line_index + context_lines + 1)
+            context = "\n".join(lines[start:end])
+
+        matches.append(
+            {"line": line_index + 1, "match": line.strip(), "context": context}
+        )
+        if len(matches) == max_matches:
+            break
+
+        # Report each line once: resume at the start of the next line
+        if line_end == len(haystack):
+            break
+        line_index += 1
+        line_start = pos = line_end + 1
+
+    return matches
+
+
+def find_in_text(
+    text: str,
+    query: str,
+    context_lines: int = 2,
+    text_lower: str | None = None,
+    max_matches: int | None = None,
+) -> list[dict[str, Any]]:
+    """Find plain text in text, ignoring case, and return matches with context.
+
+    Each line is matched on its own, so a query containing a line break
+    never matches.
+
+    Args:
+        text: Text to search in
+        query: Lowercase text to find
+        context_lines: Number of lines of context around matches
+        text_lower: text.lower(), if the caller already has it
+        max_matches: Stop after this many matches (default: find them all)
+
+    Returns list of dicts with 'line', 'match', and 'context' keys.
+    """
+    if not text or "\n" in query:
+        return []
+
+    haystack = text_lower if text_lower is not None else text.lower()
+
+    def find(pos: int) -> int:
+        return haystack.find(query, pos)
+
+    return _collect_matches(text, haystack, find, context_lines, max_matches)
 
 
 def search_in_text(
-    text: str, query: str, context_lines: int = 2, regex: bool = False
+    text: str,
+    pattern: re.Pattern[str],
+    context_lines: int = 2,
+    max_matches: int | None = None,
 ) -> list[dict[str, Any]]:
-    """Search for query in text and return matches with context.
+    """Search for a regex in text and return matches with context.
+
+    Each line is matched on its own.
 
     Args:
         text: Text to search in
-        query: Search query (plain text or regex pattern)
+        pattern: Compiled regex to search for (see compile_pattern). It
+            should be compiled with re.MULTILINE, so ^ and $ match at lines
+            and the whole text can be scanned at once (see matches_by_line).
         context_lines: Number of lines of context around matches
-        regex: If True, treat query as a regex pattern
+        max_matches: Stop after this many matches (default: find them all)
 
     Returns list of dicts with 'line', 'match', and 'context' keys.
     """
     if not text:
         return []
 
-    matches = []
-    lines = text.split("\n")
-
-    if regex:
-        import re
+    if not matches_by_line(pattern):
+        return _search_lines(text, pattern, context_lines, max_matches)
 
-        try:
-            pattern = re.compile(query, re.IGNORECASE)
-        except re.error as e:
-            # Invalid regex - return empty results
-            logger.warning(f"Invalid regex pattern '{query}': {e}")
-            return []
-
-        for i, line in enumerate(lines):
-            if pattern.search(line):
-                # Get context lines before and after
-                start = max(0, i - context_lines)
-                end = min(len(lines), i + context_lines + 1)
-                context = "\n".join(lines[start:end])
-
-                matches.append(
-                    {"line": i + 1, "match": line.strip(), "context": context}
-                )
-    else:
-        query_lower = query.lower()
-        for i, line in enumerate(lines):
-            if query_lower in line.lower():
-                # Get context lines before and after
-                start = max(0, i - context_lines)
-                end = min(len(lines), i + context_lines + 1)
-                context = "\n".join(lines[start:end])
-
-                matches.append(
-                    {"line": i + 1, "match": line.strip(), "context": context}
-                )
+    def find(pos: int) -> int:
+        m = pattern.search(text, pos)
+        return -1 if m is None else m.start()
 
-    return matches
+    return _collect_matches(text, text, find, context_lines, max_matches)
@@ -0,0 +1,225 @@
+"""Regression tests for the text search helpers in paprika_mcp.utils.
+
+The helpers scan whole texts (and whole joined columns) at once, so these
+check them against the original line-by-line search they replaced.
+"""
+
+import random
+import re
+import sys
+import time
+from collections.abc import Callable
+
+import pytest
+
+from paprika_mcp.utils import (
+    compile_pattern,
+    find_in_column,
+    find_in_text,
+    join_column,
+    matches_by_line,
+    search_in_column,
+    search_in_text,
+)
+
+TEXTS = [
+    "",
+    "salt",
+    "salt\npepper",
+    "salt \npepper\n",
+    "\n\nbake at 350\n\n",
+    "2 cups sugar\n1 cup Butter\nsugar to taste",
+    "İstanbul\nstraße\nSTRASSE",
+    "a\nb\na b\nab\n",
+    "line one\r\nline two",
+]
+
+LITERAL_QUERIES = ["a", "b", "sugar", "ss", "i̇", " ", "a b", "\n", "a\nb", "t\n"]
+
+REGEX_QUERIES = [
+    "a",
+    "^b",
+    "b$",
+    "^$",
+    "x*",
+    ".*",
+    r"a\sb",
+    r"a\s*$",
+    r"\Aa",
+    r"b\Z",
+    r"(?<=\n)b",
+    r"(?<!a)b",
+    r"a(?!\n)",
+    r"a(?=\s)",
+    "(?s).+",
+    "(?-m:^b)",
+    r"\bsalt\b",
+    r"(a)\n?\1",
+    r"[^b]*b",
+    r"a{1,2}?$",
+    r"(?i:A)(?P<x>b)?(?P=x)",
+    r"(?#comment)a$",
+]
+if sys.version_info >= (3, 11):
+    # Possessive quantifiers and atomic groups can't backtrack out of a match
+    # that runs past the end of a line
+    REGEX_QUERIES += [r"a\s*+$", r"t\s*+$", r"[^b]*+$", r"(?>a|ab)c", "a{1,2}+$"]
+
+
+def _search_lines(
+    text: str, matches_line: Callable[[str], object], context_lines: int
+) -> list[dict]:
+    """The original search: test each line of text on its own."""
+    if not text:
+        return []
+    lines = text.split("\n")
+    matches = []
+    for i, line in enumerate(lines):
+        if matches_line(line):
+            start = max(0, i - context_lines)
+            end = min(len(lines), i + context_lines + 1)
+            matches.append(
+                {
+                    "line": i + 1,
+                    "match": line.strip(),
+                    "context": "\n".join(lines[start:end]),
+                }
+            )
+    return matches
+
+
+def _contains(query_lower: str) -> Callable[[str], bool]:
+    """Match lines the way the original plain text search did."""
+    return lambda line: query_lower in line.lower()
+
+
+def _random_text(rng: random.Random) -> str:
+    return "".join(rng.choice("abAB \nİß.") for _ in range(rng.randint(0, 30)))
+
+
+@pytest.mark.parametrize("context_lines", [0, 1, 2])
+@pytest.mark.parametrize("query", LITERAL_QUERIES)
+@pytest.mark.parametrize("text", TEXTS)
+def test_find_in_text_matches_line_search(text, query, context_lines):
+    query_lower = query.lower()
+    expected = _search_lines(text, _contains(query_lower), context_lines)
+    assert find_in_text(text, query_lower, context_lines) == expected
+
+
+@pytest.mark.parametrize("context_lines", [0, 2])
+@pytest.mark.parametrize("query", REGEX_QUERIES)
+@pytest.mark.parametrize("text", TEXTS)
+def test_search_in_text_matches_line_search(text, query, context_lines):
+    line_pattern = re.compile(query, re.IGNORECASE)
+    pattern = compile_pattern(query, re.IGNORECASE | re.MULTILINE)
+    expected = _search_lines(text, line_pattern.search, context_lines)
+    assert search_in_text(text, pattern, context_lines) == expected
+
+
+def test_search_helpers_match_line_search_on_random_text():
+    rng = random.Random(0)
+    for _ in range(2000):
+        text = _random_text(rng)
+        context_lines = rng.randint(0, 3)
+        query = "".join(rng.choice("abAB .ß\n") for _ in range(rng.randint(1, 3)))
+        query_lower = query.lower()
+        expected = _search_lines(text, _contains(query_lower), context_lines)
+        assert find_in_text(text, query_lower, context_lines) == expected
+
+        query = rng.choice(REGEX_QUERIES)
+        line_pattern = re.compile(query, re.IGNORECASE)
+        pattern = compile_pattern(query, re.IGNORECASE | re.MULTILINE)
+        expected = _search_lines(text, line_pattern.search, context_lines)
+        assert search_in_text(text, pattern, context_lines) == expected
+
+
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        ("a", True),
+        (r"^ *b$", True),
+        (r"(a|b)+?\1", True),
+        (r"[\]a]\{", True),
+        (r"\w+\.\d[a-z ,]*\t", True),
+        (r"(?s).", False),
+        (r"\s", False),
+        (r"\S+", False),
+        (r"\D", False),
+        (r"\W", False),
+        (r"[\s]", False),
+        (r"[^.]*", False),
+        (r"[\t-z]", False),
+        (r"\n", False),
+        (r"\x0a", False),
+        (r"\012", False),
+        ("a\nb", False),
+        (r"\Aa", False),
+        (r"a\Z", False),
+        (r"(?<=a)b", False),
+        (r"a(?!b)", False),
+        (r"(?-m:^a)", False),
+        (r"(?x) a", False),
+        (r"(a)?(?(1)b|c)", False),
+        ("a{x", False),
+    ],
+)
+def test_matches_by_line(query, expected):
+    pattern = compile_pattern(query, re.IGNORECASE | re.MULTILINE)
+    assert matches_by_line(pattern) == expected
+
+
+@pytest.mark.skipif(sys.version_info < (3, 11), reason="needs Python 3.11 syntax")
+@pytest.mark.parametrize("query", [r"t\s*+$", r"[^b]*+$", r"(?>a|ab)c", "a++"])
+def test_possessive_and_atomic_patterns_match_by_line_only(query):
+    pattern = compile_pattern(query, re.IGNORECASE | re.MULTILINE)
+    assert not matches_by_line(pattern)
+
+
+def _matching_records(texts: list[str], pattern: re.Pattern[str]) -> set[int]:
+    """Find the records matching pattern the way search_recipes does."""
+    candidates = range(len(texts))
+    if matches_by_line(pattern):
+        candidates = search_in_column(join_column(texts), pattern)
+    return {i for i in candidates if search_in_text(texts[i], pattern, 0)}
+
+
+@pytest.mark.parametrize("query", [r"salt[^.]*saffron", r"salt\s*saffron"])
+def test_regex_search_time_stays_linear(query):
+    # Scanning the whole joined column, each "salt" would be retried up to the
+    # end of the column, so the search would grow quadratically
+    texts = ["1 tsp salt\n2 cups flour, sifted\n1 egg"] * 5000
+    pattern = compile_pattern(query, re.IGNORECASE | re.MULTILINE)
+    start = time.perf_counter()
+    assert _matching_records(texts, pattern) == set()
+    assert time.perf_counter() - start < 1
+
+
+def test_max_matches_stops_early():
+    text = "a\nb\na\na"
+    assert [m["line"] for m in find_in_text(text, "a", max_matches=2)] == [1, 3]
+    pattern = compile_pattern("^a$", re.IGNORECASE | re.MULTILINE)
+    assert [m["line"] for m in search_in_text(text, pattern, max_matches=1)] == [1]
+
+
+def test_column_scans_find_every_matching_record():
+    rng = random.Random(1)
+    for _ in range(500):
+        texts = [_random_text(rng) for _ in range(rng.randint(0, 6))]
+        lowered = [text.lower() for text in texts]
+
+        query = "".join(rng.choice("ab .\n") for _ in range(rng.randint(1, 3)))
+        expected = {
+            i
+            for i, text in enumerate(lowered)
+            if find_in_text(text, query, text_lower=text)
+        }
+        assert find_in_column(join_column(lowered), query) == expected
+
+        pattern = compile_pattern(
+            rng.choice(REGEX_QUERIES), re.IGNORECASE | re.MULTILINE
+        )
+        if not matches_by_line(pattern):
+            continue
+        expected = {i for i, text in enumerate(texts) if search_in_text(text, pattern)}
+        hits = search_in_column(join_column(texts), pattern)
+        assert {i for i in hits if texts[i]} == expected